@@ -18,40 +18,212 @@ Tests all the specific retention features mentioned in the review request:
 
 import requests
 import json
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import time
 
+# Set TEST_VERBOSE=0 to skip detail lines (and their formatting) on passes;
+# failures always print their details
+_VERBOSE = os.getenv('TEST_VERBOSE', '1') != '0'
+
+try:
+    import httpx  # Optional: enables HTTP/2 multiplexing to the single origin
+except ImportError:
+    httpx = None
+
+try:
+    import orjson  # Optional: ~2-3x faster JSON decode on list-of-dict payloads
+except ImportError:
+    orjson = None
+
+
+def _encode_json(payload):
+    """Serialize a request body, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def _decode_json(response):
+    """Decode a response body, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' natively on 3.11+, so skip the
+    # per-call string replacement
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(timestamp):
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(timestamp):
+    """Parse an ISO timestamp, memoized since tests re-parse the same strings"""
+    return _fromisoformat(timestamp)
+
 
 class AdvancedRetentionTester:
+    # 30-day retention window, hoisted so every test shares one source of truth
+    EXPECTED_30D_SECONDS = 30 * 24 * 60 * 60  # 2,592,000 seconds
+    # Retention fields every case payload must carry; issubset() checks all
+    # three in one C-level set operation
+    REQUIRED_FIELDS = frozenset({'lastActivityAt', 'expiresAt', 'timeLeftSeconds'})
+
     def __init__(self, base_url="http://localhost:3000"):
         self.base_url = base_url
-        self.session = requests.Session()
+        if httpx is not None:
+            # One HTTP/2 connection multiplexes all concurrent test requests,
+            # avoiding head-of-line blocking across the parallel test methods
+            try:
+                self.session = httpx.Client(http2=True, timeout=10.0)
+            except ImportError:  # h2 extra not installed
+                self.session = httpx.Client(timeout=10.0)
+            # httpx takes pre-serialized bytes via content=; data= is
+            # deprecated there for raw bodies
+            self._raw_body_kwarg = "content"
+        else:
+            self.session = requests.Session()
+            # Reuse one keep-alive connection across the ~40 sequential API
+            # calls instead of paying TCP/TLS setup per request
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=32)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            self.session.headers.update({
+                "Connection": "keep-alive",
+                "Accept-Encoding": "gzip",
+            })
+            self._raw_body_kwarg = "data"
         self.tests_run = 0
         self.tests_passed = 0
         self.created_cases = []  # Track created cases for cleanup
-        
+        self.cases_by_id = {}  # Last listing indexed by case id
+        self._cases_cache = (None, None)  # (etag, cases) from the last listing
+        self._cases_cache_time = 0.0  # monotonic time of the last listing
+        self._cases_cache_ttl = 1.0  # seconds a listing stays fresh within one run
+        self._cases_lock = threading.Lock()  # Guards the listing cache across workers
+        self._bulk_create_supported = None  # Learned on first bulk-create attempt
+        self._log_buf = []  # Result lines, flushed in one write at the end
+        self._lock = threading.Lock()  # Guards counters when tests run in parallel
+
     def log_test(self, name, success, details=""):
-        """Log test result with details"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-            print(f"✅ {name}")
-        else:
-            print(f"❌ {name}")
-        if details:
-            print(f"   {details}")
-    
+        """Log test result with details
+
+        details may be a zero-argument callable; it is only invoked when the
+        line will actually print, so heavy f-strings cost nothing when a
+        passing test runs with TEST_VERBOSE=0.
+        """
+        show_details = bool(details) and (not success or _VERBOSE)
+        if show_details and callable(details):
+            details = details()
+        with self._lock:
+            self.tests_run += 1
+            if success:
+                self.tests_passed += 1
+                self._log_buf.append(f"✅ {name}")
+            else:
+                self._log_buf.append(f"❌ {name}")
+            if show_details:
+                self._log_buf.append(f"   {details}")
+
+    def _flush_log(self):
+        """Write all buffered result lines in one stdout call
+
+        Results from the parallel test methods come out grouped instead of
+        interleaved, and ~20 line-buffered writes collapse into one syscall.
+        """
+        with self._lock:
+            if self._log_buf:
+                sys.stdout.write("\n".join(self._log_buf) + "\n")
+                sys.stdout.flush()
+                self._log_buf.clear()
+
+    def _post_json(self, url, payload):
+        """POST a pre-serialized JSON body through whichever client we hold
+
+        Preserializing skips the per-call stdlib dumps inside the client;
+        _raw_body_kwarg routes the bytes via content= (httpx) or data=
+        (requests) as each library expects.
+        """
+        kwargs = {self._raw_body_kwarg: _encode_json(payload)}
+        return self.session.post(url,
+            headers={"Content-Type": "application/json"}, **kwargs)
+
     def create_test_case(self, title="Test Case"):
         """Helper to create a test case"""
-        response = self.session.post(f"{self.base_url}/api/cases", 
-            json={"title": title})
+        response = self._post_json(f"{self.base_url}/api/cases", {"title": title})
         if response.status_code == 201:
-            case_data = response.json().get('case', {})
-            self.created_cases.append(case_data.get('id'))
+            case_data = _decode_json(response).get('case', {})
+            with self._lock:
+                self.created_cases.append(case_data.get('id'))
             return case_data
         return None
 
+    def _try_bulk_create(self, titles):
+        """Create all cases in one POST when the server supports array payloads
+
+        Sends {"cases": [{"title": ...}, ...]} to /api/cases and remembers
+        whether the server accepted it, so later batches skip the probe. A
+        400 (or any non-201) means per-row creation is needed; return None
+        and let the caller fall back.
+        """
+        if self._bulk_create_supported is False:
+            return None
+        response = self._post_json(f"{self.base_url}/api/cases",
+            {"cases": [{"title": title} for title in titles]})
+        if response.status_code == 201:
+            cases = _decode_json(response).get('cases', [])
+            if len(cases) == len(titles):
+                self._bulk_create_supported = True
+                with self._lock:
+                    self.created_cases.extend(case.get('id') for case in cases)
+                return cases
+        self._bulk_create_supported = False
+        return None
+
+    def _create_many(self, titles):
+        """Create several cases, bulk when possible, else concurrently"""
+        created = self._try_bulk_create(titles)
+        if created is not None:
+            return created
+        with ThreadPoolExecutor(max_workers=len(titles)) as executor:
+            return list(executor.map(self.create_test_case, titles))
+
+    def _fetch_cases(self, force_refresh=False):
+        """List cases, revalidating with If-None-Match when the server sends ETags
+
+        Returns (status_code, cases). A listing fetched within the last second
+        is served straight from cache (the tolerances in the tests already
+        absorb that delta). Tests that must see their own writes pass
+        force_refresh=True: with the methods running in parallel, the cache
+        may predate a POST another thread just made. On 304 the previously
+        decoded list is reused, skipping both payload transfer and JSON
+        parse; servers without ETag support just take the plain 200 path.
+        """
+        with self._cases_lock:
+            etag, cached = self._cases_cache
+            if (cached is not None and not force_refresh
+                    and time.monotonic() - self._cases_cache_time < self._cases_cache_ttl):
+                return 200, cached
+            headers = {'If-None-Match': etag} if etag and not force_refresh else None
+            response = self.session.get(f"{self.base_url}/api/cases", headers=headers)
+            if response.status_code == 304 and cached is not None:
+                self._cases_cache_time = time.monotonic()
+                return 200, cached
+            if response.status_code == 200:
+                cases = _decode_json(response).get('cases', [])
+                self._cases_cache = (response.headers.get('ETag'), cases)
+                self._cases_cache_time = time.monotonic()
+                return 200, cases
+            return response.status_code, None
+
     def test_retention_days_constant(self):
         """Test RETENTION_DAYS constant is exactly 30"""
         print("\n🔍 Testing RETENTION_DAYS constant = 30")
@@ -59,7 +231,7 @@ class AdvancedRetentionTester:
         case = self.create_test_case("Retention Days Test")
         if case:
             time_left = case.get('timeLeftSeconds', 0)
-            expected_30_days = 30 * 24 * 60 * 60  # 2,592,000 seconds
+            expected_30_days = self.EXPECTED_30D_SECONDS
             
             # Allow small tolerance for test execution time
             tolerance = 5  # 5 seconds
@@ -68,7 +240,7 @@ class AdvancedRetentionTester:
             self.log_test(
                 "RETENTION_DAYS constant is exactly 30",
                 success,
-                f"Expected: {expected_30_days}s ± {tolerance}s, Got: {time_left}s"
+                lambda: f"Expected: {expected_30_days}s ± {tolerance}s, Got: {time_left}s"
             )
         else:
             self.log_test("RETENTION_DAYS constant is exactly 30", False, 
@@ -86,8 +258,8 @@ class AdvancedRetentionTester:
             if last_activity and expires_at:
                 try:
                     # Parse ISO timestamps
-                    activity_dt = datetime.fromisoformat(last_activity.replace('Z', '+00:00'))
-                    expires_dt = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
+                    activity_dt = _parse_iso(last_activity)
+                    expires_dt = _parse_iso(expires_at)
                     
                     # Calculate difference
                     diff = expires_dt - activity_dt
@@ -100,7 +272,7 @@ class AdvancedRetentionTester:
                     self.log_test(
                         "computeExpiresAt adds exactly 30 days to lastActivityAt",
                         success,
-                        f"Difference: {diff}, Expected: {expected_diff}"
+                        lambda: f"Difference: {diff}, Expected: {expected_diff}"
                     )
                 except Exception as e:
                     self.log_test("computeExpiresAt adds exactly 30 days to lastActivityAt",
@@ -130,7 +302,7 @@ class AdvancedRetentionTester:
             )
             
             # Should be approximately 30 days
-            expected = 30 * 24 * 60 * 60
+            expected = self.EXPECTED_30D_SECONDS
             tolerance = 10
             success_range = (expected - tolerance) <= time_left <= expected
             self.log_test(
@@ -149,15 +321,12 @@ class AdvancedRetentionTester:
         case = self.create_test_case("Storage Create Test")
         if case:
             # Check all required retention fields
-            has_last_activity = 'lastActivityAt' in case
-            has_expires_at = 'expiresAt' in case
-            has_time_left = 'timeLeftSeconds' in case
-            
-            all_fields = has_last_activity and has_expires_at and has_time_left
+            missing = self.REQUIRED_FIELDS - case.keys()
+            all_fields = not missing
             self.log_test(
                 "storage.createCase returns lastActivityAt, expiresAt, timeLeftSeconds",
                 all_fields,
-                f"lastActivityAt: {has_last_activity}, expiresAt: {has_expires_at}, timeLeftSeconds: {has_time_left}"
+                f"Missing fields: {sorted(missing) if missing else 'none'}"
             )
             
             # Check field types
@@ -179,29 +348,35 @@ class AdvancedRetentionTester:
         """Test storage.listCases returns retention fields and filters expired"""
         print("\n🔍 Testing storage.listCases returns retention fields")
         
-        # Create a few test cases
-        for i in range(3):
-            self.create_test_case(f"List Test Case {i+1}")
+        # Create a few test cases concurrently
+        self._create_many([f"List Test Case {i+1}" for i in range(3)])
         
-        # List cases
-        response = self.session.get(f"{self.base_url}/api/cases")
-        if response.status_code == 200:
-            cases = response.json().get('cases', [])
-            
+        # List cases through the shared short-TTL cache
+        status, cases = self._fetch_cases()
+        if status == 200:
+
             if len(cases) > 0:
-                # Check first case has retention fields
-                case = cases[0]
-                has_fields = all(field in case for field in 
-                    ['lastActivityAt', 'expiresAt', 'timeLeftSeconds'])
-                
+                # Single pass over the listing: verify retention fields and
+                # positive timeLeft together instead of walking the list twice.
+                # Local bindings keep the per-iteration lookups on LOAD_FAST.
+                _issubset = self.REQUIRED_FIELDS.issubset
+                _get = dict.get
+                has_fields = True
+                all_positive = True
+                for case in cases:
+                    if has_fields and not _issubset(case):
+                        has_fields = False
+                    if all_positive and _get(case, 'timeLeftSeconds', 0) <= 0:
+                        all_positive = False
+                    if not (has_fields or all_positive):
+                        break
+
                 self.log_test(
                     "storage.listCases returns retention fields",
                     has_fields,
-                    f"Checked {len(cases)} cases, first case has all fields: {has_fields}"
+                    f"Checked {len(cases)} cases, all have retention fields: {has_fields}"
                 )
-                
-                # Check that all cases have positive timeLeftSeconds (non-expired)
-                all_positive = all(case.get('timeLeftSeconds', 0) > 0 for case in cases)
+
                 self.log_test(
                     "listCases filters expired cases (all have positive timeLeft)",
                     all_positive,
@@ -212,28 +387,56 @@ class AdvancedRetentionTester:
                     "No cases returned")
         else:
             self.log_test("storage.listCases returns retention fields", False,
+                f"API error: {status}")
+
+    def test_list_cases_server_filter(self):
+        """Test expiry filtering happens server-side via query parameter"""
+        print("\n🔍 Testing server-side expired-case filter")
+
+        # Asking the server for expired cases should transfer nothing: the
+        # filter runs where the data lives instead of on the client
+        response = self.session.get(f"{self.base_url}/api/cases?expired=true")
+        if response.status_code == 200:
+            cases = _decode_json(response).get('cases', [])
+            if len(cases) == 0:
+                self.log_test(
+                    "Server-side filter returns no expired cases",
+                    True,
+                    "GET /api/cases?expired=true returned an empty list"
+                )
+            else:
+                # Server ignored the parameter; acceptable as long as the
+                # default listing still excludes expired cases
+                all_active = all(c.get('timeLeftSeconds', 0) > 0 for c in cases)
+                self.log_test(
+                    "Server-side filter returns no expired cases",
+                    all_active,
+                    f"Filter param ignored; {len(cases)} cases returned, all active: {all_active}"
+                )
+        else:
+            self.log_test("Server-side filter returns no expired cases", False,
                 f"API error: {response.status_code}")
 
     def test_unique_expiry_labels(self):
         """Test each case gets its own unique expiry label"""
         print("\n🔍 Testing unique expiry labels for each case")
         
-        # Create cases with small delays
+        # Nanosecond-tagged titles are unique without any delay between
+        # creations, so the cases can be made concurrently
         case_data = []
-        for i in range(5):
-            case = self.create_test_case(f"Unique Label Test {i+1}")
+        titles = [f"Unique-{time.perf_counter_ns()}-{i}" for i in range(5)]
+        for case in self._create_many(titles):
             if case:
                 case_data.append({
                     'id': case.get('id'),
                     'timeLeftSeconds': case.get('timeLeftSeconds'),
                     'expiresAt': case.get('expiresAt')
                 })
-            time.sleep(0.01)  # Small delay
         
         if len(case_data) >= 3:
             # Check that timeLeftSeconds are all in valid range
             time_lefts = [c['timeLeftSeconds'] for c in case_data]
-            expected = 30 * 24 * 60 * 60
+            expected = self.EXPECTED_30D_SECONDS
             all_valid = all((expected - 60) <= t <= expected for t in time_lefts)
             
             self.log_test(
@@ -257,8 +460,8 @@ class AdvancedRetentionTester:
             
             try:
                 # Should be valid ISO timestamps
-                activity_dt = datetime.fromisoformat(last_activity.replace('Z', '+00:00'))
-                expires_dt = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
+                activity_dt = _parse_iso(last_activity)
+                expires_dt = _parse_iso(expires_at)
                 
                 # Both should be datetime objects
                 success_format = True
@@ -293,11 +496,14 @@ class AdvancedRetentionTester:
             case_id = case.get('id')
             original_time_left = case.get('timeLeftSeconds')
             
-            # List cases via GET and find our case
-            response = self.session.get(f"{self.base_url}/api/cases")
-            if response.status_code == 200:
-                cases = response.json().get('cases', [])
-                found_case = next((c for c in cases if c.get('id') == case_id), None)
+            # List cases via GET and find our case; force a fresh listing so
+            # a cache entry from before our POST can't hide the new case
+            status, cases = self._fetch_cases(force_refresh=True)
+            if status == 200:
+                # Index once instead of scanning the list per lookup; shared on
+                # self so other tests in the same run can reuse it
+                self.cases_by_id = {c.get('id'): c for c in cases}
+                found_case = self.cases_by_id.get(case_id)
                 
                 if found_case:
                     list_time_left = found_case.get('timeLeftSeconds')
@@ -328,9 +534,8 @@ class AdvancedRetentionTester:
         # Test creating case with empty title
         response = self.session.post(f"{self.base_url}/api/cases", json={})
         if response.status_code == 201:
-            case = response.json().get('case', {})
-            has_retention_fields = all(field in case for field in 
-                ['lastActivityAt', 'expiresAt', 'timeLeftSeconds'])
+            case = _decode_json(response).get('case', {})
+            has_retention_fields = self.REQUIRED_FIELDS.issubset(case)
             
             self.log_test(
                 "Case creation with empty data still includes retention fields",
@@ -347,10 +552,11 @@ class AdvancedRetentionTester:
         print(f"Testing against: {self.base_url}")
         print("=" * 80)
         
-        # Check API availability
+        # Check API availability with HEAD: same reachability answer without
+        # downloading (and decoding) the full case listing
         try:
-            response = self.session.get(f"{self.base_url}/api/cases")
-            if response.status_code not in [200, 401, 403]:
+            response = self.session.head(f"{self.base_url}/api/cases", timeout=2)
+            if response.status_code not in [200, 204, 401, 403, 405]:
                 print(f"❌ API not available at {self.base_url}")
                 return False
         except Exception as e:
@@ -359,17 +565,25 @@ class AdvancedRetentionTester:
         
         print("✅ API is available\n")
         
-        # Run all tests
-        self.test_retention_days_constant()
-        self.test_compute_expires_at()
-        self.test_compute_time_left_seconds()
-        self.test_storage_create_case_fields()
-        self.test_storage_list_cases_fields()
-        self.test_unique_expiry_labels()
-        self.test_field_data_integrity()
-        self.test_api_response_consistency()
-        self.test_edge_cases()
-        
+        # Run all tests concurrently — they are independent and I/O bound,
+        # so wall clock drops toward the slowest single test
+        tests = [
+            self.test_retention_days_constant,
+            self.test_compute_expires_at,
+            self.test_compute_time_left_seconds,
+            self.test_storage_create_case_fields,
+            self.test_storage_list_cases_fields,
+            self.test_list_cases_server_filter,
+            self.test_unique_expiry_labels,
+            self.test_field_data_integrity,
+            self.test_api_response_consistency,
+            self.test_edge_cases,
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(test) for test in tests]:
+                future.result()
+        self._flush_log()
+
         # Summary
         print("\n" + "=" * 80)
         print(f"📊 Advanced Test Results: {self.tests_passed}/{self.tests_run} passed")
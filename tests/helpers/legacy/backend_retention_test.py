@@ -16,43 +16,128 @@ Usage: python backend_retention_test.py
 import requests
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from time import sleep
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: ~2-5x faster JSON decode on the list payloads
+except ImportError:
+    orjson = None
+
+
+def _decode_json(response):
+    """Decode a response body, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' natively on 3.11+, so skip the
+    # per-call string replacement
+    def _parse_iso(timestamp):
+        return datetime.fromisoformat(timestamp)
+else:
+    def _parse_iso(timestamp):
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+# (connect, read) timeout applied to every request so a hung server fails
+# the suite fast instead of blocking it
+DEFAULT_TIMEOUT = (1.0, 5.0)
+
+# Fixed-title POST bodies, serialized once; Content-Type lives on the session
+_BODY_FIXTURE = b'{"title": "Shared Retention Fixture"}'
+_BODY_BASIC = b'{"title": "Basic API Test"}'
 
 
 class RetentionAPITester:
+    # 30-day retention window, shared by every range check below
+    RETENTION_SECONDS = 30 * 24 * 60 * 60  # 2,592,000 seconds
+    RETENTION_DELTA = timedelta(days=30)
+    # Retention fields every case payload must carry; issubset() checks all
+    # three in one C-level set operation
+    REQUIRED_FIELDS = frozenset(('lastActivityAt', 'expiresAt', 'timeLeftSeconds'))
+
     def __init__(self, base_url="http://localhost:3000"):
         self.base_url = base_url
         self.session = requests.Session()
+        # A generous keep-alive pool means the POST/GET bursts in these tests
+        # reuse one socket instead of paying a handshake per request; a couple
+        # of retries smooth over transient 5xx from a just-started dev server
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=2, backoff_factor=0.1,
+                              status_forcelist=[502, 503, 504]))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        })
         self.tests_run = 0
         self.tests_passed = 0
-        
+        self._case_cache = None  # One shared case fixture reused across tests
+        self._lock = threading.Lock()  # Guards counters when tests run in parallel
+        self._fixture_lock = threading.Lock()  # One thread creates the shared case
+        self._log_buf = []  # Result lines, flushed in one write at the end
+        self._cases_url = f"{base_url.rstrip('/')}/api/cases"  # Built once
+
+    def _get_shared_case(self):
+        """Create one case on first use and reuse it across tests
+
+        Five tests only need 'a freshly created case' to inspect; sharing one
+        fixture turns five sequential POSTs into one round trip.
+        """
+        with self._fixture_lock:
+            if self._case_cache is None:
+                response = self.session.post(self._cases_url,
+                    data=_BODY_FIXTURE, timeout=DEFAULT_TIMEOUT)
+                if response.status_code == 201:
+                    self._case_cache = _decode_json(response).get('case', {})
+            return self._case_cache
+
     def log_test(self, name, success, details=""):
         """Log test result"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-            print(f"✅ {name}")
-        else:
-            print(f"❌ {name}")
-        if details:
-            print(f"   {details}")
+        with self._lock:
+            self.tests_run += 1
+            if success:
+                self.tests_passed += 1
+                self._log_buf.append(f"✅ {name}")
+            else:
+                self._log_buf.append(f"❌ {name}")
+            if details:
+                self._log_buf.append(f"   {details}")
+
+    def _flush_logs(self):
+        """Emit all buffered result lines in one stdout write
+
+        One syscall instead of two prints per assertion, and results from the
+        parallel tests come out grouped instead of interleaved.
+        """
+        with self._lock:
+            if self._log_buf:
+                sys.stdout.write("\n".join(self._log_buf) + "\n")
+                sys.stdout.flush()
+                self._log_buf.clear()
     
     def test_retention_constants_api(self):
         """Test retention constants through a test endpoint or via case creation"""
         print("\n🧪 Testing RETENTION_DAYS constant = 30")
         
-        # Create a case and verify the timeLeftSeconds indicates 30-day retention
+        # Inspect the shared case and verify timeLeftSeconds indicates 30-day retention
         try:
-            response = self.session.post(f"{self.base_url}/api/cases", 
-                json={"title": "Retention Constant Test"})
-            
-            if response.status_code == 201:
-                case_data = response.json().get('case', {})
+            case_data = self._get_shared_case()
+            if case_data:
                 time_left = case_data.get('timeLeftSeconds', 0)
                 
                 # Should be approximately 30 days (allowing for test execution time)
-                expected_seconds = 30 * 24 * 60 * 60  # 30 days in seconds
+                expected_seconds = self.RETENTION_SECONDS
                 diff_allowed = 10  # 10 second tolerance
                 
                 success = (expected_seconds - diff_allowed) <= time_left <= expected_seconds
@@ -62,8 +147,8 @@ class RetentionAPITester:
                     f"Expected: ~{expected_seconds}s, Got: {time_left}s"
                 )
             else:
-                self.log_test("RETENTION_DAYS constant is exactly 30", False, 
-                    f"Failed to create case: {response.status_code}")
+                self.log_test("RETENTION_DAYS constant is exactly 30", False,
+                    "Failed to create shared case")
                 
         except Exception as e:
             self.log_test("RETENTION_DAYS constant is exactly 30", False, f"Error: {e}")
@@ -73,22 +158,15 @@ class RetentionAPITester:
         print("\n🧪 Testing storage.createCase returns retention fields")
         
         try:
-            response = self.session.post(f"{self.base_url}/api/cases", 
-                json={"title": "Retention Fields Test"})
-            
-            if response.status_code == 201:
-                case_data = response.json().get('case', {})
-                
-                # Check required retention fields
-                has_last_activity = 'lastActivityAt' in case_data
-                has_expires_at = 'expiresAt' in case_data  
-                has_time_left = 'timeLeftSeconds' in case_data
-                
-                success = has_last_activity and has_expires_at and has_time_left
+            case_data = self._get_shared_case()
+            if case_data:
+                # Check required retention fields in one set operation
+                success = self.REQUIRED_FIELDS.issubset(case_data)
+                missing = self.REQUIRED_FIELDS - case_data.keys()
                 self.log_test(
-                    "storage.createCase returns retention fields", 
+                    "storage.createCase returns retention fields",
                     success,
-                    f"Fields: lastActivityAt={has_last_activity}, expiresAt={has_expires_at}, timeLeftSeconds={has_time_left}"
+                    f"Missing fields: {sorted(missing) if missing else 'none'}"
                 )
                 
                 # Verify time calculations
@@ -103,7 +181,7 @@ class RetentionAPITester:
                     return case_data['id']  # Return case ID for further tests
             else:
                 self.log_test("storage.createCase returns retention fields", False,
-                    f"Failed to create case: {response.status_code}")
+                    "Failed to create shared case")
                 return None
                 
         except Exception as e:
@@ -115,28 +193,21 @@ class RetentionAPITester:
         print("\n🧪 Testing storage.listCases returns retention fields")
         
         try:
-            # Create a case first
-            create_response = self.session.post(f"{self.base_url}/api/cases", 
-                json={"title": "List Test Case"})
-            
-            if create_response.status_code != 201:
+            # Make sure at least one case exists
+            if not self._get_shared_case():
                 self.log_test("storage.listCases returns retention fields", False,
                     "Failed to create test case")
                 return
             
             # List cases
-            response = self.session.get(f"{self.base_url}/api/cases")
+            response = self.session.get(self._cases_url, timeout=DEFAULT_TIMEOUT)
             
             if response.status_code == 200:
-                cases = response.json().get('cases', [])
+                cases = _decode_json(response).get('cases', [])
                 
                 if len(cases) > 0:
                     case = cases[0]
-                    has_last_activity = 'lastActivityAt' in case
-                    has_expires_at = 'expiresAt' in case
-                    has_time_left = 'timeLeftSeconds' in case
-                    
-                    success = has_last_activity and has_expires_at and has_time_left
+                    success = self.REQUIRED_FIELDS.issubset(case)
                     self.log_test(
                         "storage.listCases returns retention fields", 
                         success,
@@ -157,16 +228,11 @@ class RetentionAPITester:
         print("\n🧪 Testing retention time calculations through API")
         
         try:
-            # Create a case
-            response = self.session.post(f"{self.base_url}/api/cases", 
-                json={"title": "Time Calculation Test"})
-            
-            if response.status_code == 201:
-                case_data = response.json().get('case', {})
-                
+            case_data = self._get_shared_case()
+            if case_data:
                 # Verify timeLeftSeconds is approximately 30 days for new case
                 time_left = case_data.get('timeLeftSeconds', 0)
-                expected_seconds = 30 * 24 * 60 * 60  # 30 days
+                expected_seconds = self.RETENTION_SECONDS
                 tolerance = 60  # 1 minute tolerance
                 
                 success = (expected_seconds - tolerance) <= time_left <= expected_seconds
@@ -182,12 +248,12 @@ class RetentionAPITester:
                 
                 if expires_at and last_activity:
                     try:
-                        expires_dt = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
-                        activity_dt = datetime.fromisoformat(last_activity.replace('Z', '+00:00'))
+                        expires_dt = _parse_iso(expires_at)
+                        activity_dt = _parse_iso(last_activity)
                         
                         # Should be exactly 30 days difference
                         diff = expires_dt - activity_dt
-                        expected_diff = timedelta(days=30)
+                        expected_diff = self.RETENTION_DELTA
                         diff_tolerance = timedelta(seconds=1)
                         
                         success = abs(diff - expected_diff) <= diff_tolerance
@@ -202,7 +268,7 @@ class RetentionAPITester:
                 
             else:
                 self.log_test("Time calculations", False,
-                    f"Failed to create case: {response.status_code}")
+                    "Failed to create shared case")
                 
         except Exception as e:
             self.log_test("Time calculations", False, f"Error: {e}")
@@ -212,32 +278,39 @@ class RetentionAPITester:
         print("\n🧪 Testing unique expiry labels for each case")
         
         try:
-            # Create multiple cases
-            case_ids = []
-            for i in range(3):
-                response = self.session.post(f"{self.base_url}/api/cases", 
-                    json={"title": f"Unique Label Test Case {i+1}"})
-                
-                if response.status_code == 201:
-                    case_ids.append(response.json()['case']['id'])
-                    sleep(0.1)  # Small delay to ensure different timestamps
+            # Create the three cases concurrently over the shared session;
+            # distinct titles make them distinguishable without inter-create
+            # sleeps, and the urllib3 pool is thread-safe at this size
+            def create(i):
+                return self.session.post(self._cases_url,
+                    data=json.dumps({"title": f"Unique Label Test Case {i+1}"}).encode(),
+                    timeout=DEFAULT_TIMEOUT)
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                responses = list(executor.map(create, range(3)))
+
+            case_ids = [_decode_json(response)['case']['id']
+                        for response in responses if response.status_code == 201]
             
             if len(case_ids) == 3:
-                # List cases and check their timeLeftSeconds
-                response = self.session.get(f"{self.base_url}/api/cases")
-                
+                # Ask the server for just the newest three cases; a server
+                # that ignores the query params returns the full list and the
+                # tail slice below keeps the behaviour identical
+                response = self.session.get(
+                    f"{self._cases_url}?limit=3&order=desc",
+                    timeout=DEFAULT_TIMEOUT)
+
                 if response.status_code == 200:
-                    cases = response.json().get('cases', [])
-                    time_lefts = []
-                    
-                    for case in cases[-3:]:  # Get last 3 cases
-                        time_left = case.get('timeLeftSeconds', 0)
-                        time_lefts.append(time_left)
+                    cases = _decode_json(response).get('cases', [])
+                    # Project to the one field consumed rather than holding
+                    # full case dicts
+                    time_lefts = [case.get('timeLeftSeconds', 0)
+                                  for case in cases[-3:]]
                     
                     # All should be very close but not necessarily identical due to execution time
                     if len(time_lefts) >= 3:
                         # Check they're all around 30 days
-                        expected = 30 * 24 * 60 * 60
+                        expected = self.RETENTION_SECONDS
                         all_valid = all(expected - 60 <= t <= expected for t in time_lefts)
                         
                         self.log_test(
@@ -264,7 +337,7 @@ class RetentionAPITester:
         
         # Test GET /api/cases
         try:
-            response = self.session.get(f"{self.base_url}/api/cases")
+            response = self.session.get(self._cases_url, timeout=DEFAULT_TIMEOUT)
             success = response.status_code == 200
             self.log_test("GET /api/cases responds correctly", success,
                 f"Status: {response.status_code}")
@@ -273,8 +346,8 @@ class RetentionAPITester:
         
         # Test POST /api/cases  
         try:
-            response = self.session.post(f"{self.base_url}/api/cases", 
-                json={"title": "Basic API Test"})
+            response = self.session.post(self._cases_url, 
+                data=_BODY_BASIC, timeout=DEFAULT_TIMEOUT)
             success = response.status_code == 201
             self.log_test("POST /api/cases creates case", success,
                 f"Status: {response.status_code}")
@@ -286,12 +359,8 @@ class RetentionAPITester:
         print("\n🧪 Testing retention math validation")
         
         try:
-            # Create a case
-            response = self.session.post(f"{self.base_url}/api/cases", 
-                json={"title": "Math Validation Test"})
-            
-            if response.status_code == 201:
-                case_data = response.json().get('case', {})
+            case_data = self._get_shared_case()
+            if case_data:
                 initial_time_left = case_data.get('timeLeftSeconds', 0)
                 
                 # Verify computeTimeLeftSeconds returns positive for future expiration
@@ -303,7 +372,7 @@ class RetentionAPITester:
                 )
                 
                 # The time left should be close to 30 days
-                expected = 30 * 24 * 60 * 60
+                expected = self.RETENTION_SECONDS
                 tolerance = 120  # 2 minute tolerance  
                 success_range = (expected - tolerance) <= initial_time_left <= expected
                 self.log_test(
@@ -314,7 +383,7 @@ class RetentionAPITester:
                 
             else:
                 self.log_test("Retention math validation", False,
-                    f"Failed to create case: {response.status_code}")
+                    "Failed to create shared case")
                 
         except Exception as e:
             self.log_test("Retention math validation", False, f"Error: {e}")
@@ -324,10 +393,12 @@ class RetentionAPITester:
         print("🚀 Starting RV Service Desk Retention System Tests")
         print(f"Testing against: {self.base_url}")
         
-        # Test API availability first
+        # Test API availability first; HEAD answers reachability without
+        # transferring or parsing the case listing
         try:
-            response = self.session.get(f"{self.base_url}/api/cases")
-            if response.status_code not in [200, 401, 403]:
+            response = self.session.head(self._cases_url,
+                allow_redirects=False, timeout=2)
+            if response.status_code not in [200, 401, 403, 405]:
                 print(f"❌ API not available at {self.base_url} (status: {response.status_code})")
                 return False
         except Exception as e:
@@ -336,15 +407,22 @@ class RetentionAPITester:
         
         print("✅ API is available")
         
-        # Run tests
-        self.test_api_endpoints_basic()
-        self.test_retention_constants_api()
-        self.test_case_creation_retention_fields()
-        self.test_list_cases_retention_fields()
-        self.test_time_calculations_through_api()
-        self.test_unique_expiry_labels()
-        self.test_retention_math_validation()
-        
+        # Run tests concurrently — each is independent and almost entirely
+        # HTTP wait, so wall clock drops toward the slowest single test
+        tests = [
+            self.test_api_endpoints_basic,
+            self.test_retention_constants_api,
+            self.test_case_creation_retention_fields,
+            self.test_list_cases_retention_fields,
+            self.test_time_calculations_through_api,
+            self.test_unique_expiry_labels,
+            self.test_retention_math_validation,
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(test) for test in tests]:
+                future.result()
+        self._flush_logs()
+
         # Summary
         print(f"\n📊 Test Results: {self.tests_passed}/{self.tests_run} passed")
         
@@ -24,44 +24,59 @@ class RVServiceDeskBehavioralTester:
         self.tests_run = 0
         self.tests_passed = 0
         self.results = []
+        # One vitest bootstrap serves all seven suite checks; per-file runs
+        # re-transform every test module just to execute a subset
+        self._suite_report = None
+        self._suite_rc = None
+
+    def _get_suite_report(self):
+        """Run the full vitest suite once and cache the parsed JSON report."""
+        if self._suite_report is None:
+            report_file = f"/tmp/vitest-behavioral-report-{os.getpid()}.json"
+            result = subprocess.run(
+                ["npx", "vitest", "run", "--reporter=json", f"--outputFile={report_file}"],
+                cwd=self.app_dir, capture_output=True, text=True, timeout=180
+            )
+            self._suite_rc = result.returncode
+            try:
+                with open(report_file) as f:
+                    self._suite_report = json.load(f)
+                os.remove(report_file)
+            except (OSError, ValueError):
+                self._suite_report = {}
+        return self._suite_report
 
     def log(self, message, level="INFO"):
         timestamp = datetime.now().strftime("%H:%M:%S")
         print(f"[{timestamp}] [{level}] {message}")
 
     def run_specific_test(self, test_name, test_file):
-        """Run a specific test file"""
+        """Check a specific test file's result in the cached suite run"""
         self.tests_run += 1
         self.log(f"Running: {test_name}")
-        
+
         try:
-            os.chdir(self.app_dir)
-            result = subprocess.run(
-                ["npx", "vitest", "run", test_file, "--reporter=basic"], 
-                capture_output=True, text=True, timeout=60
-            )
-            
-            if result.returncode == 0:
+            module = None
+            for candidate in self._get_suite_report().get("testResults", []):
+                if test_file in candidate.get("name", ""):
+                    module = candidate
+                    break
+
+            if module is not None and module.get("status") == "passed":
                 self.tests_passed += 1
                 self.results.append({"test": test_name, "status": "PASS", "details": "✅"})
                 self.log(f"✅ PASS - {test_name}")
-                
-                # Extract passed test count
-                output = result.stdout + result.stderr
-                if "passed" in output:
-                    lines = output.split('\n')
-                    for line in lines:
-                        if "✓" in line or "passed" in line.lower():
-                            details = line.strip()
-                            if details and len(details) < 100:
-                                self.log(f"   {details}")
-                            break
+                passed = sum(1 for case in module.get("assertionResults", [])
+                             if case.get("status") == "passed")
+                if passed:
+                    self.log(f"   {passed} tests passed in {test_file}")
                 return True
             else:
-                self.results.append({"test": test_name, "status": "FAIL", "details": result.stderr[:200]})
-                self.log(f"❌ FAIL - {test_name}: {result.stderr[:200]}")
+                detail = "file not found in suite report" if module is None else "module failed"
+                self.results.append({"test": test_name, "status": "FAIL", "details": detail})
+                self.log(f"❌ FAIL - {test_name}: {detail}")
                 return False
-                
+
         except Exception as e:
             self.results.append({"test": test_name, "status": "ERROR", "details": str(e)})
             self.log(f"❌ ERROR - {test_name}: {str(e)}")
@@ -113,39 +128,17 @@ class RVServiceDeskBehavioralTester:
         """Test 7: Complete test suite (all 447 tests)"""
         self.tests_run += 1
         self.log("Running: Complete Vitest Suite (all 447 tests)")
-        
+
         try:
-            os.chdir(self.app_dir)
-            result = subprocess.run(
-                ["npx", "vitest", "run", "--reporter=basic"], 
-                capture_output=True, text=True, timeout=120
-            )
-            
-            output = result.stdout + result.stderr
-            
-            if result.returncode == 0 and "447 passed" in output:
+            report = self._get_suite_report()
+            passed_tests = report.get("numPassedTests", 0)
+
+            if self._suite_rc == 0 and passed_tests == 447:
                 self.tests_passed += 1
                 self.results.append({"test": "Complete Vitest Suite", "status": "PASS", "details": "447 tests passed"})
                 self.log("✅ PASS - Complete Vitest Suite: All 447 tests passed")
                 return True
             else:
-                passed_tests = 0
-                total_tests = 0
-                
-                # Try to extract test counts
-                for line in output.split('\n'):
-                    if "passed" in line and "Tests" in line:
-                        try:
-                            # Extract numbers from lines like "Tests    447 passed (447)"
-                            parts = line.split()
-                            for i, part in enumerate(parts):
-                                if part.isdigit() and i > 0:
-                                    if "passed" in parts[i+1:i+2]:
-                                        passed_tests = int(part)
-                                        break
-                        except:
-                            pass
-                
                 self.results.append({
                     "test": "Complete Vitest Suite", 
                     "status": "PARTIAL" if passed_tests > 400 else "FAIL", 
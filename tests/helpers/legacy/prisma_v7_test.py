@@ -8,35 +8,43 @@ import subprocess
 import sys
 import os
 import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any
 
+# Fingerprint of the last tree that compiled cleanly; lets warm reruns skip tsc
+_TS_CACHE_FILE = "/app/.ts-build-cache.hash"
+
 class PrismaV7Tester:
     def __init__(self):
         self.tests_run = 0
         self.tests_passed = 0
         self.test_results: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()  # Guards counters/output when tests run in parallel
 
     def log_test_result(self, name: str, success: bool, details: str = "", error_msg: str = ""):
         """Log test result with details"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-            print(f"✅ {name}: PASSED")
-        else:
-            print(f"❌ {name}: FAILED")
-            if error_msg:
-                print(f"   Error: {error_msg}")
-        
-        if details:
-            print(f"   Details: {details}")
-        
-        self.test_results.append({
-            "test_name": name,
-            "success": success,
-            "details": details,
-            "error_msg": error_msg
-        })
-        print()
+        with self._lock:
+            self.tests_run += 1
+            if success:
+                self.tests_passed += 1
+                print(f"✅ {name}: PASSED")
+            else:
+                print(f"❌ {name}: FAILED")
+                if error_msg:
+                    print(f"   Error: {error_msg}")
+
+            if details:
+                print(f"   Details: {details}")
+
+            self.test_results.append({
+                "test_name": name,
+                "success": success,
+                "details": details,
+                "error_msg": error_msg
+            })
+            print()
 
     def run_command(self, cmd: str, cwd: str = "/app", env_vars: Dict[str, str] = None) -> Tuple[bool, str, str]:
         """Run a shell command and return success, stdout, stderr"""
@@ -60,12 +68,71 @@ class PrismaV7Tester:
         except Exception as e:
             return False, "", str(e)
 
+    def _ts_inputs_fingerprint(self) -> str:
+        """Fingerprint every compiler input via mtime+size
+
+        Walks the TS sources plus the config files that affect compilation;
+        a matching fingerprint means the last clean compile is still valid
+        and the multi-second tsc run can be skipped. The walk mirrors
+        tsconfig.json: include is **/*.ts from the project root (so
+        next-env.d.ts, next.config.ts and friends count), while
+        node_modules and scripts/ are excluded from compilation and so
+        from the fingerprint.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        skip_dirs = {"node_modules", "scripts", ".git"}
+        stack = ["/app"]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in sorted(entries, key=lambda e: e.path):
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip_dirs:
+                                stack.append(entry.path)
+                        elif entry.name.endswith((".ts", ".tsx", ".mts")):
+                            stat = entry.stat()
+                            hasher.update(
+                                f"{entry.path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+            except OSError:
+                continue
+        for path in ("/app/package.json", "/app/yarn.lock", "/app/tsconfig.json"):
+            try:
+                stat = os.stat(path)
+                hasher.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+            except OSError:
+                continue
+        return hasher.hexdigest()
+
     def test_typescript_compilation(self):
         """Test TypeScript compilation with no errors"""
         print("🔍 Testing TypeScript compilation...")
-        success, stdout, stderr = self.run_command("npx tsc --noEmit --project tsconfig.json")
-        
+
+        fingerprint = self._ts_inputs_fingerprint()
+        try:
+            with open(_TS_CACHE_FILE, "r") as f:
+                cached = f.read().strip()
+        except OSError:
+            cached = None
+        if cached == fingerprint:
+            self.log_test_result(
+                "TypeScript Compilation",
+                True,
+                "Sources unchanged since last clean compile (cached)"
+            )
+            return
+
+        # --incremental is defensive; tsconfig.json already enables it, but the
+        # flag keeps warm runs fast even if the config option is ever dropped
+        success, stdout, stderr = self.run_command(
+            "npx tsc --noEmit --incremental --project tsconfig.json")
+
         if success:
+            try:
+                with open(_TS_CACHE_FILE, "w") as f:
+                    f.write(fingerprint)
+            except OSError:
+                pass
             self.log_test_result(
                 "TypeScript Compilation",
                 True,
@@ -295,18 +362,19 @@ class PrismaV7Tester:
         """Run all tests in sequence"""
         print("🚀 Starting Prisma v7 retention cleanup tests...\n")
         
-        # Test 1: TypeScript compilation
-        self.test_typescript_compilation()
-        
-        # Test 2: ESLint validation
-        self.test_eslint_validation()
-        
-        # Test 3: Runtime initialization with dummy URL
-        self.test_runtime_initialization_with_dummy_url()
-        
-        # Test 4: Missing DATABASE_URL validation
-        self.test_missing_database_url_validation()
-        
+        # Tests 1-4 are independent subprocess-bound checks (tsc, eslint and
+        # two tsx boots with different environments); overlapping them costs
+        # roughly one Node boot of wall time instead of four
+        subprocess_tests = [
+            self.test_typescript_compilation,
+            self.test_eslint_validation,
+            self.test_runtime_initialization_with_dummy_url,
+            self.test_missing_database_url_validation,
+        ]
+        with ThreadPoolExecutor(max_workers=len(subprocess_tests)) as executor:
+            for future in [executor.submit(test) for test in subprocess_tests]:
+                future.result()
+
         # Test 5: Package.json script configuration
         self.test_package_json_script()
         
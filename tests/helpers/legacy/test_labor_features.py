@@ -9,9 +9,11 @@ Focused test for the three labor confirmation features:
 This test focuses on unit test validation and direct function testing.
 """
 
+import os
 import sys
 import subprocess
 import json
+import threading
 from datetime import datetime
 
 class LaborConfirmationFeatureTest:
@@ -19,54 +21,79 @@ class LaborConfirmationFeatureTest:
         self.tests_run = 0
         self.tests_passed = 0
         self.feature_results = {}
+        self._lock = threading.Lock()  # Keeps run_test safe if callers ever parallelize
+        # One full vitest run serves every feature check; per-file re-runs
+        # would each pay the whole bootstrap for tests the suite covers anyway
+        self._suite_report = None
+        self._suite_rc = None
+        self._report_lock = threading.Lock()
+
+    def _get_suite_report(self):
+        """Run the full vitest suite once and cache the parsed JSON report."""
+        with self._report_lock:
+            if self._suite_report is None:
+                report_file = f"/tmp/vitest-labor-report-{os.getpid()}.json"
+                result = subprocess.run(
+                    ["yarn", "test", "--run", "--reporter=json", f"--outputFile={report_file}"],
+                    cwd="/app",
+                    capture_output=True,
+                    text=True,
+                    timeout=120
+                )
+                self._suite_rc = result.returncode
+                try:
+                    with open(report_file) as f:
+                        self._suite_report = json.load(f)
+                    os.remove(report_file)
+                except (OSError, ValueError):
+                    self._suite_report = {}
+            return self._suite_report
+
+    def _file_passes(self, name_fragment):
+        """True when the test module matching name_fragment passed in the cached run."""
+        for module in self._get_suite_report().get("testResults", []):
+            if name_fragment in module.get("name", ""):
+                return module.get("status") == "passed"
+        return False
 
     def run_test(self, name, test_func):
         """Run a single test and track results"""
         print(f"\n🔍 Testing {name}...")
-        self.tests_run += 1
-        
+        with self._lock:
+            self.tests_run += 1
+
         try:
             result = test_func()
             if result:
-                self.tests_passed += 1
+                with self._lock:
+                    self.tests_passed += 1
+                    self.feature_results[name] = "PASS"
                 print(f"✅ Passed - {name}")
-                self.feature_results[name] = "PASS"
                 return True
             else:
+                with self._lock:
+                    self.feature_results[name] = "FAIL"
                 print(f"❌ Failed - {name}")
-                self.feature_results[name] = "FAIL"
                 return False
         except Exception as e:
+            with self._lock:
+                self.feature_results[name] = f"ERROR: {str(e)}"
             print(f"❌ Failed - {name}: {str(e)}")
-            self.feature_results[name] = f"ERROR: {str(e)}"
             return False
 
     def test_labor_confirmation_unit_tests(self):
         """Test labor confirmation feature through comprehensive unit tests"""
         try:
-            result = subprocess.run(
-                ["yarn", "test", "tests/labor-confirmation.test.ts"], 
-                cwd="/app",
-                capture_output=True, 
-                text=True, 
-                timeout=60
-            )
-            
-            if result.returncode == 0:
+            if self._file_passes("labor-confirmation.test.ts"):
                 print("   ✅ All labor confirmation unit tests pass")
-                print("   ✅ extractLaborEstimate function works")  
+                print("   ✅ extractLaborEstimate function works")
                 print("   ✅ parseLaborConfirmation function works")
-                print("   ✅ validateLaborSum function works") 
+                print("   ✅ validateLaborSum function works")
                 print("   ✅ Labor store operations work")
                 print("   ✅ validateLaborConfirmationOutput function works")
-                
-                # Extract test count
-                if "32 passed" in result.stdout:
-                    print("   ✅ All 32 labor confirmation tests passed")
-                
                 return True
             else:
-                print(f"   ❌ Labor confirmation tests failed: {result.stderr[:200]}")
+                print("   ❌ Labor confirmation tests failed in the cached suite run")
                 return False
         except Exception as e:
             print(f"   ❌ Error running tests: {str(e)}")
@@ -75,28 +102,15 @@ class LaborConfirmationFeatureTest:
     def test_copy_button_ux_unit_tests(self):
         """Test copy button UX feature through unit tests"""
         try:
-            result = subprocess.run(
-                ["yarn", "test", "tests/copy-button-ux.test.ts"], 
-                cwd="/app",
-                capture_output=True, 
-                text=True, 
-                timeout=60
-            )
-            
-            if result.returncode == 0:
+            if self._file_passes("copy-button-ux.test.ts"):
                 print("   ✅ All copy button UX unit tests pass")
                 print("   ✅ Per-message copy state tracking works")
-                print("   ✅ Auto-reset after 1.5s works") 
+                print("   ✅ Auto-reset after 1.5s works")
                 print("   ✅ Visual feedback (checkmark + 'Copied!') works")
                 print("   ✅ Independent report copy button state works")
-                
-                # Extract test count
-                if "9 passed" in result.stdout:
-                    print("   ✅ All 9 copy button UX tests passed")
-                
                 return True
             else:
-                print(f"   ❌ Copy button UX tests failed: {result.stderr[:200]}")
+                print("   ❌ Copy button UX tests failed in the cached suite run")
                 return False
         except Exception as e:
             print(f"   ❌ Error running tests: {str(e)}")
@@ -105,27 +119,14 @@ class LaborConfirmationFeatureTest:
     def test_mode_validators_labor_confirmation(self):
         """Test that mode validators properly handle labor_confirmation mode"""
         try:
-            result = subprocess.run(
-                ["yarn", "test", "tests/mode-validators.test.ts"], 
-                cwd="/app",
-                capture_output=True, 
-                text=True, 
-                timeout=60
-            )
-            
-            if result.returncode == 0:
+            if self._file_passes("mode-validators.test.ts"):
                 print("   ✅ All mode validator unit tests pass")
                 print("   ✅ CaseMode includes 'labor_confirmation'")
                 print("   ✅ validateOutput handles labor_confirmation mode")
                 print("   ✅ getSafeFallback handles labor_confirmation mode")
-                
-                # Check for labor confirmation in output
-                if "labor_confirmation" in result.stdout.lower():
-                    print("   ✅ labor_confirmation mode testing found in output")
-                
                 return True
             else:
-                print(f"   ❌ Mode validator tests failed: {result.stderr[:200]}")
+                print("   ❌ Mode validator tests failed in the cached suite run")
                 return False
         except Exception as e:
             print(f"   ❌ Error running tests: {str(e)}")
@@ -134,37 +135,30 @@ class LaborConfirmationFeatureTest:
     def test_comprehensive_suite(self):
         """Test that all 394 tests still pass"""
         try:
-            result = subprocess.run(
-                ["yarn", "test"], 
-                cwd="/app",
-                capture_output=True, 
-                text=True, 
-                timeout=120
-            )
-            
-            if result.returncode == 0:
+            report = self._get_suite_report()
+
+            if self._suite_rc == 0:
                 print("   ✅ All 394 unit tests pass")
-                
+
                 # Verify specific counts
-                if "394 passed" in result.stdout:
+                if report.get("numPassedTests") == 394:
                     print("   ✅ Confirmed: 394 tests passed")
-                    
+
                 # Check for the three features
+                module_names = [m.get("name", "") for m in report.get("testResults", [])]
                 features_found = {
-                    "labor-confirmation": "labor-confirmation" in result.stdout,
-                    "copy-button-ux": "copy-button-ux" in result.stdout, 
-                    "mode-validators": "mode-validators" in result.stdout,
+                    feature: any(feature in name for name in module_names)
+                    for feature in ("labor-confirmation", "copy-button-ux", "mode-validators")
                 }
-                
-                all_found = all(features_found.values())
-                if all_found:
+
+                if all(features_found.values()):
                     print("   ✅ All three feature test files found and ran")
                 else:
                     print("   ⚠️  Some feature test files not detected in output")
-                
+
                 return True
             else:
-                print(f"   ❌ Comprehensive test suite failed: {result.stderr[:200]}")
+                print("   ❌ Comprehensive test suite failed")
                 return False
         except Exception as e:
             print(f"   ❌ Error running comprehensive tests: {str(e)}")
@@ -211,16 +205,17 @@ class LaborConfirmationFeatureTest:
         print("3. Copy Button UX - visual feedback with checkmark + 'Copied!' text")
         print("=" * 80)
 
-        # Run focused tests for each feature
-        print("\n" + "=" * 25 + " FEATURE 1: LABOR TIME CONSISTENCY " + "=" * 25)
-        self.run_test("Labor Time Consistency (validateLaborSum)", self.test_labor_confirmation_unit_tests)
-        
-        print("\n" + "=" * 25 + " FEATURE 2: LABOR CONFIRMATION STEP " + "=" * 25)
-        self.run_test("Labor Confirmation Mode (CaseMode)", self.test_mode_validators_labor_confirmation)
-        
-        print("\n" + "=" * 25 + " FEATURE 3: COPY BUTTON UX " + "=" * 25)
-        self.run_test("Copy Button Visual Feedback", self.test_copy_button_ux_unit_tests)
-        
+        # Run focused tests for each feature; all three just slice the single
+        # cached suite report, so there is nothing left to overlap
+        print("\n" + "=" * 25 + " FEATURES 1-3: FOCUSED TESTS " + "=" * 25)
+        feature_tests = [
+            ("Labor Time Consistency (validateLaborSum)", self.test_labor_confirmation_unit_tests),
+            ("Labor Confirmation Mode (CaseMode)", self.test_mode_validators_labor_confirmation),
+            ("Copy Button Visual Feedback", self.test_copy_button_ux_unit_tests),
+        ]
+        for name, func in feature_tests:
+            self.run_test(name, func)
+
         print("\n" + "=" * 25 + " IMPLEMENTATION VALIDATION " + "=" * 25)
         self.run_test("Feature Implementation Check", self.validate_feature_implementation)
         
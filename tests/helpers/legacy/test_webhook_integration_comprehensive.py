@@ -1,71 +1,55 @@
 #!/usr/bin/env python3
 
-import requests
-import json
+import os
 import sys
 import subprocess
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-class StripeWebhookIntegrationTester:
-    def __init__(self, base_url="http://localhost:3000"):
-        self.base_url = base_url
-        self.tests_run = 0
-        self.tests_passed = 0
+from api_test_base import APITesterBase
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
-        """Run a single API test"""
-        url = f"{self.base_url}/{endpoint}"
-        default_headers = {'Content-Type': 'application/json'}
-        if headers:
-            default_headers.update(headers)
+try:
+    import responses
+except ImportError:
+    responses = None
 
-        self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
-        print(f"   URL: {method} {url}")
-        
-        try:
-            kwargs = {'headers': default_headers}
-                
-            if method == 'GET':
-                response = requests.get(url, **kwargs)
-            elif method == 'POST':
-                response = requests.post(url, json=data, **kwargs)
+# Constant per-test fixtures, built once at import instead of per call
+_LOGGING_PATTERNS = (
+    ("[Stripe Webhook] Received event:", "/app/src/lib/b2b-stripe.ts"),
+    ("[Stripe Sync] Updating org", "/app/src/lib/firestore.ts"),
+    ("[Stripe Sync] Looking up org by stripeCustomerId", "/app/src/lib/firestore.ts"),
+    ("customer.subscription.updated", "/app/src/lib/b2b-stripe.ts"),
+)
 
-            success = response.status_code == expected_status
-            if success:
-                self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
-                try:
-                    response_data = response.json()
-                    print(f"   Response: {json.dumps(response_data, indent=2)[:300]}...")
-                    return True, response_data
-                except:
-                    return True, {}
-            else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
-                try:
-                    error_data = response.json()
-                    print(f"   Error: {error_data}")
-                except:
-                    print(f"   Error text: {response.text[:200]}")
-                return False, {}
+_FALLBACK_PATTERNS = (
+    "getOrgByStripeCustomerId",
+    "No orgId in metadata, looking up by customer",
+    "if (!orgId && customerId)",
+    "subscription.customer",
+)
 
-        except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
-            return False, {}
+_WEBHOOK_TEST_FILES = (
+    "tests/stripe-webhook.test.ts",
+    "tests/billing-portal-upgrades.test.ts",
+    "tests/b2b-billing.test.ts",
+)
+
+# Canned replies for TEST_MOCK=1 runs: each probe's endpoint mapped to the
+# status and body a healthy backend would return
+_MOCK_ENDPOINTS = (
+    ("POST", "api/billing/webhook", 400, {"error": "Missing stripe-signature header"}),
+    ("GET", "api/debug/org-seats", 401, {"error": "Unauthorized"}),
+    ("GET", "api/auth/me", 401, {"error": "Unauthorized"}),
+)
+
+class StripeWebhookIntegrationTester(APITesterBase):
 
     def test_webhook_logging_patterns(self):
         """Test that webhook logging patterns are present in the code"""
         print(f"\n🔍 Testing Webhook Logging Patterns in Code...")
         
         # Check if the logging patterns mentioned in the request are in the code
-        logging_patterns = [
-            ("[Stripe Webhook] Received event:", "/app/src/lib/b2b-stripe.ts"),
-            ("[Stripe Sync] Updating org", "/app/src/lib/firestore.ts"),
-            ("[Stripe Sync] Looking up org by stripeCustomerId", "/app/src/lib/firestore.ts"),
-            ("customer.subscription.updated", "/app/src/lib/b2b-stripe.ts")
-        ]
-        
+        logging_patterns = _LOGGING_PATTERNS
+
         patterns_found = 0
         self.tests_run += 1
         
@@ -100,13 +84,8 @@ class StripeWebhookIntegrationTester:
                 content = f.read()
                 
             # Check for fallback logic patterns
-            fallback_patterns = [
-                "getOrgByStripeCustomerId",
-                "No orgId in metadata, looking up by customer",
-                "if (!orgId && customerId)",
-                "subscription.customer"
-            ]
-            
+            fallback_patterns = _FALLBACK_PATTERNS
+
             patterns_found = 0
             for pattern in fallback_patterns:
                 if pattern in content:
@@ -133,7 +112,8 @@ class StripeWebhookIntegrationTester:
             "Debug Org Seats Endpoint Structure",
             "GET",
             "api/debug/org-seats",
-            401  # Expected since we're not authenticated
+            401,  # Expected since we're not authenticated
+            inspect_body=False
         )
         
         # Check that the endpoint exists (returns 401, not 404)
@@ -146,9 +126,10 @@ class StripeWebhookIntegrationTester:
         """Test that auth/me endpoint structure includes seat data"""
         success, response = self.run_test(
             "Auth Me Endpoint Structure",
-            "GET", 
+            "GET",
             "api/auth/me",
-            401  # Expected since we're not authenticated
+            401,  # Expected since we're not authenticated
+            inspect_body=False
         )
         
         # Check that the endpoint exists (returns 401, not 404)
@@ -220,15 +201,9 @@ class StripeWebhookIntegrationTester:
         """Run specific webhook-related tests"""
         print(f"\n🔍 Running Specific Webhook Tests...")
         
-        webhook_test_files = [
-            "tests/stripe-webhook.test.ts",
-            "tests/billing-portal-upgrades.test.ts",
-            "tests/b2b-billing.test.ts"
-        ]
-        
         all_passed = True
-        
-        for test_file in webhook_test_files:
+
+        for test_file in _WEBHOOK_TEST_FILES:
             try:
                 result = subprocess.run(
                     ["yarn", "test", test_file, "--run"], 
@@ -275,17 +250,25 @@ class StripeWebhookIntegrationTester:
         self.test_webhook_logging_patterns()
         self.test_fallback_mechanism_in_code()
         
-        # Test API endpoints
+        # Test API endpoints; the probes are independent and latency-bound,
+        # so overlap them on the shared pooled session
         print("\n" + "=" * 30 + " API ENDPOINT TESTS " + "=" * 30)
-        self.test_webhook_endpoint_signature_validation()
-        self.test_debug_endpoint_functionality()
-        self.test_auth_me_returns_seat_data()
+        probes = [
+            self.test_webhook_endpoint_signature_validation,
+            self.test_debug_endpoint_functionality,
+            self.test_auth_me_returns_seat_data,
+        ]
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            for future in [executor.submit(probe) for probe in probes]:
+                future.result()
         
         # Test comprehensive functionality
         print("\n" + "=" * 30 + " COMPREHENSIVE TESTS " + "=" * 30)
         self.test_specific_webhook_tests()
         self.test_comprehensive_unit_tests()
 
+        self.close()
+
         # Print results
         print("\n" + "=" * 80)
         print(f"📊 Stripe Webhook Integration Tests Results: {self.tests_passed}/{self.tests_run} passed")
@@ -305,6 +288,17 @@ class StripeWebhookIntegrationTester:
 
 def main():
     tester = StripeWebhookIntegrationTester()
+    if os.getenv('TEST_MOCK') == '1':
+        if responses is None:
+            print("⚠️  TEST_MOCK=1 requires the 'responses' package; running against the live backend")
+        else:
+            # Intercept the endpoint probes so the assertion logic can be
+            # exercised without a running backend; the yarn-driven tests
+            # still need node and are unaffected
+            with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+                for method, endpoint, status, body in _MOCK_ENDPOINTS:
+                    mock.add(method, f"{tester.base_url}/{endpoint}", json=body, status=status)
+                return tester.run_all_tests()
     return tester.run_all_tests()
 
 if __name__ == "__main__":